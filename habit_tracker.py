@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import bisect
 import json
 import os
-from dataclasses import dataclass, asdict
+import secrets
+import sys
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Dict, List, Optional
-import uuid
+
+try:
+    import orjson  # optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 DATA_DIR = "data"
 DATA_PATH = os.path.join(DATA_DIR, "habits.json")
 SCHEMA_VERSION = 1
 
+# Set by actions that change habits; main() only writes the file when set.
+_dirty = False
+
+# Last parsed store per path, keyed on (inode, mtime_ns, size) so edits and
+# save_store's replace-by-rename invalidate it. main() loads once per process,
+# so the CLI itself never hits this; it only pays off for repeated in-process
+# load_store() calls, at the cost of keeping the parsed store alive.
+_store_cache: Dict[str, tuple] = {}
+
 
 # ---------- Utilities ----------
 
@@ -20,6 +36,23 @@ def today_iso() -> str:
 def parse_iso(d: str) -> date:
     return date.fromisoformat(d)
 
+def iso_ordinals(days: List[str]) -> List[int]:
+    """Parse ISO dates into day ordinals in a single pass.
+
+    Uses date.fromisoformat directly (C-implemented); never strptime or a
+    general-purpose parser for these fixed-format strings."""
+    fromiso = date.fromisoformat
+    return [fromiso(d).toordinal() for d in days]
+
+def run_starts(ords: List[int]) -> List[int]:
+    """For sorted ordinals, the first ordinal of the consecutive run each one ends."""
+    starts: List[int] = []
+    prev = None
+    for o in ords:
+        starts.append(starts[-1] if prev is not None and o == prev + 1 else o)
+        prev = o
+    return starts
+
 def clear_screen() -> None:
     # Polite CLI: optional clear
     os.system("cls" if os.name == "nt" else "clear")
@@ -50,33 +83,74 @@ def ask_nonempty(prompt: str, max_len: int = 50) -> str:
 
 # ---------- Data Model ----------
 
-@dataclass
+@dataclass(slots=True)
 class Habit:
     id: str
     name: str
     created_at: str  # ISO date
-    completions: List[str]  # list of ISO dates (unique)
+    completions: List[str]  # sorted list of ISO dates (unique)
+    _completed: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _sorted_ords: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _run_start: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Built once; kept in sync by mark/unmark so lookups never rebuild it.
+        self._completed = set(self.completions)
+        # ISO dates sort chronologically, so bisect can keep this ordered.
+        self.completions = sorted(self._completed)
+        self._sorted_ords = sorted(iso_ordinals(self.completions))
+        self._run_start = run_starts(self._sorted_ords)
 
     def completion_set(self) -> set[str]:
-        return set(self.completions)
+        return self._completed
 
     def is_completed_on(self, iso_day: str) -> bool:
-        return iso_day in self.completion_set()
+        return iso_day in self._completed
+
+    def status(self, ref_ord: int) -> tuple[bool, int]:
+        """(done on ref day, current streak) from a single binary search.
+        The streak ends at ref_ord if done, otherwise at the day before."""
+        ords = self._sorted_ords
+        i = bisect.bisect_right(ords, ref_ord) - 1
+        if i < 0 or ords[i] < ref_ord - 1:
+            return False, 0
+        return ords[i] == ref_ord, ords[i] - self._run_start[i] + 1
+
+    def days_done_in_week(self, ref_ord: int) -> int:
+        """Completions in the 7 days ending at ref_ord (inclusive)."""
+        ords = self._sorted_ords
+        return bisect.bisect_right(ords, ref_ord) - bisect.bisect_left(ords, ref_ord - 6)
 
     def mark_complete(self, iso_day: str) -> bool:
-        s = self.completion_set()
-        if iso_day in s:
+        if iso_day in self._completed:
             return False
-        s.add(iso_day)
-        self.completions = sorted(s)
+        self._completed.add(iso_day)
+        day_ord = parse_iso(iso_day).toordinal()
+        ords = self._sorted_ords
+        if not ords or day_ord > ords[-1]:
+            # Common case (marking today): extend the last run in O(1).
+            extends = bool(ords) and ords[-1] == day_ord - 1
+            self._run_start.append(self._run_start[-1] if extends else day_ord)
+            ords.append(day_ord)
+        else:
+            bisect.insort(ords, day_ord)
+            self._run_start = run_starts(ords)
+        bisect.insort(self.completions, iso_day)
         return True
 
     def unmark_complete(self, iso_day: str) -> bool:
-        s = self.completion_set()
-        if iso_day not in s:
+        if iso_day not in self._completed:
             return False
-        s.remove(iso_day)
-        self.completions = sorted(s)
+        self._completed.remove(iso_day)
+        day_ord = parse_iso(iso_day).toordinal()
+        ords = self._sorted_ords
+        i = bisect.bisect_left(ords, day_ord)
+        del ords[i]
+        if i == len(ords):
+            self._run_start.pop()
+        else:
+            self._run_start = run_starts(ords)
+        del self.completions[bisect.bisect_left(self.completions, iso_day)]
         return True
 
 
@@ -85,18 +159,36 @@ class Habit:
 def ensure_data_dir() -> None:
     os.makedirs(DATA_DIR, exist_ok=True)
 
+def _dumps(obj: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def _loads(data: bytes) -> Dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def default_store() -> Dict:
     return {"version": SCHEMA_VERSION, "habits": []}
 
 def load_store() -> Dict:
     ensure_data_dir()
-    if not os.path.exists(DATA_PATH):
+    try:
+        st = os.stat(DATA_PATH)
+    except OSError:
         return default_store()
 
+    # Callers must treat the returned store as read-only: it may be shared.
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _store_cache.get(DATA_PATH)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
     try:
-        with open(DATA_PATH, "r", encoding="utf-8") as f:
-            store = json.load(f)
-    except (json.JSONDecodeError, OSError):
+        with open(DATA_PATH, "rb") as f:
+            store = _loads(f.read())
+    except (ValueError, OSError):  # JSONDecodeError (json or orjson) is a ValueError
         # If file is corrupted, don't crash. Start fresh but keep a backup.
         backup = DATA_PATH + ".bak"
         try:
@@ -117,14 +209,60 @@ def load_store() -> Dict:
     if not isinstance(store["habits"], list):
         store["habits"] = []
 
+    _store_cache[DATA_PATH] = (key, store)
     return store
 
 def save_store(store: Dict) -> None:
     ensure_data_dir()
-    with open(DATA_PATH, "w", encoding="utf-8") as f:
-        json.dump(store, f, indent=2)
+    # Write to a temp file and swap it in, so a crash mid-write can never
+    # leave a truncated habits.json behind (load_store would discard it).
+    data = _dumps(store)
+    tmp = DATA_PATH + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, DATA_PATH)
+
+def mark_dirty() -> None:
+    global _dirty
+    _dirty = True
+
+def save_if_dirty(habits: List[Habit]) -> None:
+    """Write habits to disk only if an action changed them since the last save."""
+    global _dirty
+    if not _dirty:
+        return
+    save_store(store_from_habits(habits))
+    _dirty = False
+
+def clean_completions(raw: object) -> List[str]:
+    """Keep only valid, unique ISO date strings, sorted. Bad entries are dropped
+    here so a hand-edited file can't crash a later streak computation."""
+    if not isinstance(raw, list):
+        return []
+    good = []
+    seen = set()
+    for d in raw:
+        if not isinstance(d, str) or d in seen:
+            continue
+        # Cheap shape check first: rejects most garbage without raising, and
+        # keeps out forms like "20240101" that fromisoformat (3.11+) accepts
+        # but that would break the sorted-string order of completions.
+        if len(d) != 10 or d[4] != "-" or d[7] != "-":
+            continue
+        try:
+            date.fromisoformat(d)
+        except ValueError:
+            continue
+        seen.add(d)
+        good.append(d)
+    good.sort()
+    return good
 
 def habits_from_store(store: Dict) -> List[Habit]:
+    # Completion dates are parsed to ordinals exactly once here (via
+    # Habit.__post_init__); later streak/summary queries never re-parse.
     habits = []
     for h in store.get("habits", []):
         if not isinstance(h, dict):
@@ -134,7 +272,7 @@ def habits_from_store(store: Dict) -> List[Habit]:
                 id=str(h.get("id", "")),
                 name=str(h.get("name", "")),
                 created_at=str(h.get("created_at", today_iso())),
-                completions=list(h.get("completions", [])),
+                completions=clean_completions(h.get("completions", [])),
             )
         )
     # Drop broken entries (no id/name)
@@ -142,55 +280,70 @@ def habits_from_store(store: Dict) -> List[Habit]:
     return habits
 
 def store_from_habits(habits: List[Habit]) -> Dict:
-    return {"version": SCHEMA_VERSION, "habits": [asdict(h) for h in habits]}
+    return {
+        "version": SCHEMA_VERSION,
+        "habits": [
+            {
+                "id": h.id,
+                "name": h.name,
+                "created_at": h.created_at,
+                "completions": h.completions,
+            }
+            for h in habits
+        ],
+    }
+
+
+class LazyHabits:
+    """Loads habits (and their lookup indices) on first use, so opening the
+    menu and exiting straight away never touches the data file."""
+
+    def __init__(self) -> None:
+        self._habits: Optional[List[Habit]] = None
+        # Lowercased names, for O(1) case-insensitive duplicate checks on add.
+        self.name_index: set[str] = set()
+        self.id_index: Dict[str, Habit] = {}
+
+    def get(self) -> List[Habit]:
+        if self._habits is None:
+            self._habits = habits_from_store(load_store())
+            # Fill in place: the index objects are handed out before loading.
+            self.name_index.update(h.name.lower() for h in self._habits)
+            self.id_index.update((h.id, h) for h in self._habits)
+        return self._habits
+
+    def save(self) -> None:
+        # Nothing can have changed before the first load.
+        if self._habits is not None:
+            save_if_dirty(self._habits)
 
 
 # ---------- Core Logic ----------
 
-def find_habit(habits: List[Habit], habit_id: str) -> Optional[Habit]:
-    for h in habits:
-        if h.id == habit_id:
-            return h
-    return None
+def find_habit(id_index: Dict[str, Habit], habit_id: str) -> Optional[Habit]:
+    return id_index.get(habit_id)
 
 def current_streak(habit: Habit, ref: Optional[date] = None) -> int:
     """Count consecutive days completed ending at ref (default today),
     allowing streak to end at today if completed today, otherwise yesterday if not."""
     if ref is None:
         ref = date.today()
-
-    completed = habit.completion_set()
-    if not completed:
-        return 0
-
-    # Determine the starting day to count from: today if done, else yesterday.
-    start = ref
-    if start.isoformat() not in completed:
-        start = ref - timedelta(days=1)
-
-    streak = 0
-    day = start
-    while day.isoformat() in completed:
-        streak += 1
-        day -= timedelta(days=1)
-
-    return streak
+    return habit.status(ref.toordinal())[1]
 
 def weekly_summary(habit: Habit, ref: Optional[date] = None) -> int:
     """Count completions in last 7 days including ref day."""
     if ref is None:
         ref = date.today()
-    completed = habit.completion_set()
-    days = [(ref - timedelta(days=i)).isoformat() for i in range(7)]
-    return sum(1 for d in days if d in completed)
+    return habit.days_done_in_week(ref.toordinal())
 
 
 # ---------- CLI UI ----------
 
+def header_lines(title: str) -> List[str]:
+    return ["=" * 40, title, "=" * 40]
+
 def print_header(title: str) -> None:
-    print("=" * 40)
-    print(title)
-    print("=" * 40)
+    print("\n".join(header_lines(title)))
 
 def choose_habit(habits: List[Habit]) -> Optional[Habit]:
     if not habits:
@@ -215,34 +368,45 @@ def choose_habit(habits: List[Habit]) -> Optional[Habit]:
 
 def action_list(habits: List[Habit]) -> None:
     clear_screen()
-    print_header("Your Habits")
+    # Build the whole screen and write it once instead of a print per habit.
+    lines = header_lines("Your Habits")
     if not habits:
-        print("No habits yet.")
-        return
-
-    t = today_iso()
-    for h in habits:
-        done = "✅" if h.is_completed_on(t) else "—"
-        streak = current_streak(h)
-        print(f"- {h.name}  [{done}]  Streak: {streak}")
-
-def action_add(habits: List[Habit]) -> None:
+        lines.append("No habits yet.")
+    else:
+        # Read the clock once for the whole list, not once per habit.
+        t_ord = date.today().toordinal()
+        for h in habits:
+            done_today, streak = h.status(t_ord)
+            done = "✅" if done_today else "—"
+            lines.append(f"- {h.name}  [{done}]  Streak: {streak}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def action_add(habits: List[Habit], name_index: set[str], id_index: Dict[str, Habit]) -> None:
     clear_screen()
     print_header("Add a Habit")
     name = ask_nonempty("Habit name: ")
 
     # Prevent duplicates by name (case-insensitive)
-    if any(h.name.lower() == name.lower() for h in habits):
+    key = name.lower()
+    if key in name_index:
         print("A habit with that name already exists.")
         return
 
+    # 8 hex chars from 4 random bytes; retry on the (rare) clash with an existing id.
+    new_id = secrets.token_hex(4)
+    while new_id in id_index:
+        new_id = secrets.token_hex(4)
+
     h = Habit(
-        id=uuid.uuid4().hex[:8],
+        id=new_id,
         name=name,
         created_at=today_iso(),
         completions=[],
     )
     habits.append(h)
+    name_index.add(key)
+    id_index[h.id] = h
+    mark_dirty()
     print(f"Added habit: {h.name}")
 
 def action_mark_today(habits: List[Habit]) -> None:
@@ -252,6 +416,7 @@ def action_mark_today(habits: List[Habit]) -> None:
     if not h:
         return
     if h.mark_complete(today_iso()):
+        mark_dirty()
         print(f"Marked '{h.name}' complete for today.")
     else:
         print(f"'{h.name}' is already marked complete today.")
@@ -263,6 +428,7 @@ def action_unmark_today(habits: List[Habit]) -> None:
     if not h:
         return
     if h.unmark_complete(today_iso()):
+        mark_dirty()
         print(f"Unmarked '{h.name}' for today.")
     else:
         print(f"'{h.name}' was not marked complete today.")
@@ -274,33 +440,34 @@ def action_details(habits: List[Habit]) -> None:
     if not h:
         return
 
-    streak = current_streak(h)
-    t = today_iso()
-    done_today = h.is_completed_on(t)
+    today = date.today()
+    done_today, streak = h.status(today.toordinal())
 
     print(f"\nName: {h.name}")
     print(f"Created: {h.created_at}")
     print(f"Done today: {'Yes' if done_today else 'No'}")
     print(f"Current streak: {streak}")
 
-    last7 = [ (date.today() - timedelta(days=i)).isoformat() for i in range(6, -1, -1) ]
+    last7 = [ (today - timedelta(days=i)).isoformat() for i in range(6, -1, -1) ]
+    completed = h.completion_set()
     print("\nLast 7 days:")
     for d in last7:
-        mark = "✅" if d in h.completion_set() else "—"
+        mark = "✅" if d in completed else "—"
         print(f"  {d}: {mark}")
 
 def action_weekly_summary(habits: List[Habit]) -> None:
     clear_screen()
-    print_header("Weekly Summary (Last 7 Days)")
+    lines = header_lines("Weekly Summary (Last 7 Days)")
     if not habits:
-        print("No habits yet.")
-        return
-
-    for h in habits:
-        hits = weekly_summary(h)
-        print(f"- {h.name}: {hits}/7 days")
+        lines.append("No habits yet.")
+    else:
+        today = date.today()
+        for h in habits:
+            hits = weekly_summary(h, today)
+            lines.append(f"- {h.name}: {hits}/7 days")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def action_delete(habits: List[Habit]) -> None:
+def action_delete(habits: List[Habit], name_index: set[str], id_index: Dict[str, Habit]) -> None:
     clear_screen()
     print_header("Delete a Habit")
     h = choose_habit(habits)
@@ -309,14 +476,20 @@ def action_delete(habits: List[Habit]) -> None:
     confirm = ask_choice(f"Delete '{h.name}'? (y/n): ", ["y", "n"])
     if confirm == "y":
         habits.remove(h)
+        # A hand-edited file can hold the same name in different cases; keep
+        # the key while any remaining habit still uses it.
+        key = h.name.lower()
+        if not any(o.name.lower() == key for o in habits):
+            name_index.discard(key)
+        id_index.pop(h.id, None)
+        mark_dirty()
         print("Deleted.")
     else:
         print("Cancelled.")
 
 
 def main() -> None:
-    store = load_store()
-    habits = habits_from_store(store)
+    habits = LazyHabits()
 
     while True:
         clear_screen()
@@ -333,33 +506,33 @@ def main() -> None:
         choice = input("\nChoose an option: ").strip()
 
         if choice == "1":
-            action_list(habits)
+            action_list(habits.get())
             prompt_enter()
         elif choice == "2":
-            action_add(habits)
-            save_store(store_from_habits(habits))
+            action_add(habits.get(), habits.name_index, habits.id_index)
+            habits.save()
             prompt_enter()
         elif choice == "3":
-            action_mark_today(habits)
-            save_store(store_from_habits(habits))
+            action_mark_today(habits.get())
+            habits.save()
             prompt_enter()
         elif choice == "4":
-            action_unmark_today(habits)
-            save_store(store_from_habits(habits))
+            action_unmark_today(habits.get())
+            habits.save()
             prompt_enter()
         elif choice == "5":
-            action_details(habits)
+            action_details(habits.get())
             prompt_enter()
         elif choice == "6":
-            action_weekly_summary(habits)
+            action_weekly_summary(habits.get())
             prompt_enter()
         elif choice == "7":
-            action_delete(habits)
-            save_store(store_from_habits(habits))
+            action_delete(habits.get(), habits.name_index, habits.id_index)
+            habits.save()
             prompt_enter()
         elif choice == "0":
-            # Autosave on exit too
-            save_store(store_from_habits(habits))
+            # Autosave on exit too (no-op unless something is unsaved)
+            habits.save()
             print("Goodbye!")
             break
         else: